@@ -19,13 +19,15 @@ Configuration: Change TIMEFRAME_MINUTES in the class to adjust timeframe
 """
 
 from AlgorithmImports import *
+from collections import deque
 from framework.interfaces import IStrategy
 from framework.bar_builder import BarBuilder
 from framework.logging_service import BacktestLogger
 from strategy_config import (
     TIMEFRAME_MINUTES, START_DATE, END_DATE, STARTING_CAPITAL, 
     STRATEGY_VERSION, SYMBOL, LOGGING_ENABLED, RUN_ID, 
-    LOG_TRADES, LOG_DAILY_PERFORMANCE, LOG_INDICATORS, LOG_ENTRY_CONDITIONS
+    LOG_TRADES, LOG_DAILY_PERFORMANCE, LOG_INDICATORS, LOG_ENTRY_CONDITIONS,
+    LOG_BARS, DEBUG_PLOTS, DEBUG_PLOT_EVERY_N_BARS
 )
 
 
@@ -56,18 +58,33 @@ class VolaBreakoutStrategy(IStrategy):
         self.bbw_threshold = 0.1  # BBW threshold for low volatility
         self.recent_high_period = 5
         self.trail_percent = 0.05  # 5% trailing stop
+        self._one_minus_trail = 1 - self.trail_percent  # Stop multiplier, precomputed once
         
         # Manual indicator tracking (since we use custom bars)
-        self.ema_values = []
-        self.bb_values = []  # Store tuples of (upper, middle, lower)
-        self.price_history = []
-        self.high_history = []
+        # Fixed-size ring buffers: appends evict the oldest value in O(1)
+        max_history = max(self.ema_period, self.bb_period) + self.recent_high_period + 10
+        self.ema_values = deque(maxlen=50)
+        self.bb_values = deque(maxlen=50)  # Store tuples of (upper, middle, lower)
+        self.price_history = deque(maxlen=max_history)
+        self.high_history = deque(maxlen=max_history)
+        
+        # Rolling Bollinger window with running sums (O(1) update per bar)
+        self._bb_window = deque(maxlen=self.bb_period)
+        self._bb_sum = 0.0
+        self._bb_sumsq = 0.0
         
         # State tracking
         self.position_entry_price = None
         self.highest_price_since_entry = None
         self.entry_time = None
         
+        # Per-bar debug output switches (cached once; checked on every bar)
+        self._log_bars = LOG_BARS
+        self._log_entry = LOG_ENTRY_CONDITIONS
+        self._debug_plots = DEBUG_PLOTS
+        self._plot_every = max(1, DEBUG_PLOT_EVERY_N_BARS)
+        self._plot_counter = 0
+        
         # Initialize logging service
         self.logger = BacktestLogger(
             algorithm=algorithm,
@@ -103,18 +120,14 @@ class VolaBreakoutStrategy(IStrategy):
         current_holdings = algorithm.Portfolio[self.symbol].Quantity
         
         # DEBUG: Log every bar completion
-        algorithm.Log(f"{TIMEFRAME_MINUTES}MIN BAR COMPLETED: {bar.Time} | O:{bar.Open:.2f} H:{bar.High:.2f} L:{bar.Low:.2f} C:{bar.Close:.2f}")
+        if self._log_bars:
+            algorithm.Log("%dMIN BAR COMPLETED: %s | O:%.2f H:%.2f L:%.2f C:%.2f" % (
+                TIMEFRAME_MINUTES, bar.Time, bar.Open, bar.High, bar.Low, bar.Close))
         
-        # Update price and high history
+        # Update price and high history (bounded by the deque maxlen)
         self.price_history.append(current_price)
         self.high_history.append(bar.High)
         
-        # Keep only needed history (for indicators and lookbacks)
-        max_history = max(self.ema_period, self.bb_period) + self.recent_high_period + 10
-        if len(self.price_history) > max_history:
-            self.price_history = self.price_history[-max_history:]
-            self.high_history = self.high_history[-max_history:]
-        
         # Update indicators
         self._update_indicators(bar)
         
@@ -146,7 +159,7 @@ class VolaBreakoutStrategy(IStrategy):
         # Entry logic
         if current_holdings == 0:
             entry_conditions = self._get_entry_conditions_dict(current_price, bar)
-            entry_signal = self._check_entry_conditions(current_price, bar)
+            entry_signal = self._check_entry_conditions(entry_conditions)
             
             # Log entry conditions if enabled
             if LOG_ENTRY_CONDITIONS:
@@ -176,7 +189,8 @@ class VolaBreakoutStrategy(IStrategy):
         
         # Exit logic (trailing stop)
         elif current_holdings > 0:
-            if self._check_exit_conditions(current_price):
+            # Trailing stop: exit if price drops more than trail_percent from highest price
+            if current_price <= self.highest_price_since_entry * self._one_minus_trail:
                 # Calculate hold period
                 hold_days = None
                 if self.entry_time:
@@ -200,11 +214,21 @@ class VolaBreakoutStrategy(IStrategy):
                 self.entry_time = None
             else:
                 # Update highest price for trailing stop
-                if current_price > self.highest_price_since_entry:
-                    self.highest_price_since_entry = current_price
+                self.highest_price_since_entry = max(self.highest_price_since_entry, current_price)
 
     def _update_indicators(self, bar):
         """Update EMA and Bollinger Bands manually"""
+        close = bar.Close
+        
+        # Slide the Bollinger window: evict the oldest close once full
+        if len(self._bb_window) == self.bb_period:
+            evicted = self._bb_window[0]
+            self._bb_sum -= evicted
+            self._bb_sumsq -= evicted * evicted
+        self._bb_window.append(close)
+        self._bb_sum += close
+        self._bb_sumsq += close * close
+        
         if len(self.price_history) < 2:
             return
             
@@ -219,12 +243,11 @@ class VolaBreakoutStrategy(IStrategy):
             self.ema_values.append(ema)
         
         # Update Bollinger Bands (need at least bb_period values)
-        if len(self.price_history) >= self.bb_period:
-            recent_prices = self.price_history[-self.bb_period:]
-            sma = sum(recent_prices) / len(recent_prices)
+        if len(self._bb_window) == self.bb_period:
+            sma = self._bb_sum / self.bb_period
             
-            # Calculate standard deviation
-            variance = sum((price - sma) ** 2 for price in recent_prices) / len(recent_prices)
+            # Population variance from running sums (clamped against rounding)
+            variance = max(self._bb_sumsq / self.bb_period - sma * sma, 0.0)
             std_dev = variance ** 0.5
             
             bb_upper = sma + (self.bb_std * std_dev)
@@ -232,52 +255,23 @@ class VolaBreakoutStrategy(IStrategy):
             bb_middle = sma
             
             self.bb_values.append((bb_upper, bb_middle, bb_lower))
-            
-            # Keep reasonable history
-            if len(self.bb_values) > 100:
-                self.bb_values = self.bb_values[-50:]
-        
-        # Keep reasonable EMA history
-        if len(self.ema_values) > 100:
-            self.ema_values = self.ema_values[-50:]
 
-    def _check_entry_conditions(self, current_price, bar):
-        """Check all entry conditions"""
-        # Need sufficient data for all indicators
-        if len(self.ema_values) < 2 or len(self.bb_values) < 1:
+    def _check_entry_conditions(self, entry_conditions):
+        """Entry signal from the conditions built by _get_entry_conditions_dict"""
+        if not entry_conditions.get("all_conditions_met", False):
             return False
         
-        if len(self.price_history) < self.recent_high_period + 2:
-            return False
-        
-        # 1. inTrend = price > ema and price rising
-        ema_current = self.ema_values[-1]
-        prev_price = self.price_history[-2]
-        in_trend = current_price > ema_current and current_price > prev_price
-        
-        # 2. isLowBBW = bbw < bbwThreshold
-        bb_upper, bb_middle, bb_lower = self.bb_values[-1]
-        bb_width = (bb_upper - bb_lower) / bb_middle if bb_middle > 0 else 1.0
-        is_low_bbw = bb_width < self.bbw_threshold
-        
-        # 3. breakAboveBB = close > bbUpper
-        break_above_bb = current_price > bb_upper
-        
-        # 4. breakAboveRecentHigh = close > highest(high, 5)[1]
-        if len(self.high_history) >= self.recent_high_period + 1:
-            recent_highs = self.high_history[-(self.recent_high_period+1):-1]  # Exclude current bar
-            recent_high = max(recent_highs)
-            break_above_recent_high = current_price > recent_high
-        else:
-            break_above_recent_high = False
-        
-        # All conditions must be true
-        entry_signal = in_trend and is_low_bbw and break_above_bb and break_above_recent_high
-        
-        if entry_signal:
-            self.algorithm.Log(f"ENTRY SIGNAL ({TIMEFRAME_MINUTES}min): Price=${current_price:.2f}, EMA=${ema_current:.2f}, BBW={bb_width:.3f}, BB_Upper=${bb_upper:.2f}, Recent_High=${recent_high:.2f}")
+        if self._log_entry:
+            self.algorithm.Log("ENTRY SIGNAL (%dmin): Price=$%.2f, EMA=$%.2f, BBW=%.3f, BB_Upper=$%.2f, Recent_High=$%.2f" % (
+                TIMEFRAME_MINUTES, entry_conditions["current_price"], entry_conditions["ema_current"],
+                entry_conditions["bb_width"], entry_conditions["bb_upper"], entry_conditions["recent_high"]))
         
-        return entry_signal
+        return True
+
+    def _recent_high(self):
+        """Highest high of the previous recent_high_period bars (excludes current bar)"""
+        highs = self.high_history
+        return max(highs[i] for i in range(-(self.recent_high_period + 1), -1))
 
     def _get_entry_conditions_dict(self, current_price, bar):
         """Get all entry conditions as a dictionary for logging"""
@@ -296,8 +290,7 @@ class VolaBreakoutStrategy(IStrategy):
         # Calculate recent high
         recent_high = 0
         if len(self.high_history) >= self.recent_high_period + 1:
-            recent_highs = self.high_history[-(self.recent_high_period+1):-1]
-            recent_high = max(recent_highs)
+            recent_high = self._recent_high()
         
         # Individual conditions
         in_trend = current_price > ema_current and current_price > prev_price
@@ -323,7 +316,14 @@ class VolaBreakoutStrategy(IStrategy):
         }
 
     def _plot_debug_data(self, algorithm, current_price, bar):
-        """Plot debugging data to charts"""
+        """Plot debugging data to charts (sampled every DEBUG_PLOT_EVERY_N_BARS bars)"""
+        if not self._debug_plots:
+            return
+        
+        self._plot_counter += 1
+        if (self._plot_counter - 1) % self._plot_every:
+            return
+        
         if len(self.ema_values) == 0 or len(self.bb_values) == 0:
             return
             
@@ -342,36 +342,30 @@ class VolaBreakoutStrategy(IStrategy):
         algorithm.Plot("Bollinger Band Width", "BBW Threshold", self.bbw_threshold)
         
         # Plot Entry Conditions (as flags when true)
-        try:
-            if len(self.price_history) >= self.recent_high_period + 2:
-                # Check individual conditions
-                ema_current = self.ema_values[-1]
-                prev_price = self.price_history[-2]
-                in_trend = current_price > ema_current and current_price > prev_price
-                
-                is_low_bbw = bb_width < self.bbw_threshold
-                break_above_bb = current_price > bb_upper
-                
-                if len(self.high_history) >= self.recent_high_period + 1:
-                    recent_highs = self.high_history[-(self.recent_high_period+1):-1]
-                    recent_high = max(recent_highs)
-                    break_above_recent_high = current_price > recent_high
-                else:
-                    break_above_recent_high = False
-                
-                # Plot flags (1 when condition is true, 0 otherwise)
-                algorithm.Plot("Entry Conditions", "Trend OK", 1 if in_trend else 0)
-                algorithm.Plot("Entry Conditions", "Low Vol OK", 1 if is_low_bbw else 0)
-                algorithm.Plot("Entry Conditions", "BB Breakout OK", 1 if break_above_bb else 0)
-                algorithm.Plot("Entry Conditions", "Momentum OK", 1 if break_above_recent_high else 0)
-                
-                # Overall entry signal
-                entry_signal = in_trend and is_low_bbw and break_above_bb and break_above_recent_high
-                algorithm.Plot("Entry Conditions", "Entry Signal", 1 if entry_signal else 0)
-                
-        except Exception as e:
-            # Don't let plotting errors break the strategy
-            pass
+        if len(self.price_history) >= self.recent_high_period + 2:
+            # Check individual conditions
+            ema_current = self.ema_values[-1]
+            prev_price = self.price_history[-2]
+            in_trend = current_price > ema_current and current_price > prev_price
+            
+            is_low_bbw = bb_width < self.bbw_threshold
+            break_above_bb = current_price > bb_upper
+            
+            if len(self.high_history) >= self.recent_high_period + 1:
+                recent_high = self._recent_high()
+                break_above_recent_high = current_price > recent_high
+            else:
+                break_above_recent_high = False
+            
+            # Plot flags (1 when condition is true, 0 otherwise)
+            algorithm.Plot("Entry Conditions", "Trend OK", 1 if in_trend else 0)
+            algorithm.Plot("Entry Conditions", "Low Vol OK", 1 if is_low_bbw else 0)
+            algorithm.Plot("Entry Conditions", "BB Breakout OK", 1 if break_above_bb else 0)
+            algorithm.Plot("Entry Conditions", "Momentum OK", 1 if break_above_recent_high else 0)
+            
+            # Overall entry signal
+            entry_signal = in_trend and is_low_bbw and break_above_bb and break_above_recent_high
+            algorithm.Plot("Entry Conditions", "Entry Signal", 1 if entry_signal else 0)
         
         # Plot Position & Performance
         position_value = algorithm.Portfolio[self.symbol].HoldingsValue
@@ -382,15 +376,6 @@ class VolaBreakoutStrategy(IStrategy):
         algorithm.Plot("Position & Performance", "Cash", cash)
         algorithm.Plot("Position & Performance", "Total Portfolio", total_portfolio)
 
-    def _check_exit_conditions(self, current_price):
-        """Check trailing stop exit condition"""
-        if self.highest_price_since_entry is None:
-            return False
-        
-        # Trailing stop: exit if price drops more than trail_percent from highest price
-        stop_price = self.highest_price_since_entry * (1 - self.trail_percent)
-        return current_price <= stop_price
-
     def on_end_of_algorithm(self, algorithm):
         """Called at the end of the algorithm"""
         final_portfolio_value = algorithm.Portfolio.TotalPortfolioValue
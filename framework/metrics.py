@@ -135,29 +135,46 @@ Backtest Period: {self.backtest_period.days:.0f} days
         
         self.total_trades = len(self._trades)
         
+        # Aggregate all trade statistics in a single pass
+        wins = 0
+        total_pnl = 0.0
+        gross_profit = 0.0
+        loss_sum = 0.0
+        first_entry = self._trades[0].entry_time
+        last_exit = self._trades[0].exit_time
+        
+        for trade in self._trades:
+            total_pnl += trade.pnl
+            if trade.is_win:
+                wins += 1
+                gross_profit += trade.pnl
+            else:
+                loss_sum += trade.pnl
+            
+            if trade.entry_time < first_entry:
+                first_entry = trade.entry_time
+            if trade.exit_time > last_exit:
+                last_exit = trade.exit_time
+        
+        losses = self.total_trades - wins
+        gross_loss = -loss_sum
+        
         # Calculate total return
-        total_pnl = sum(trade.pnl for trade in self._trades)
         self.total_return = total_pnl / self.starting_capital
         
         # Calculate win rate
-        wins = sum(1 for trade in self._trades if trade.is_win)
         self.win_rate = wins / self.total_trades
         
         # Calculate average win/loss
-        winning_trades = [trade for trade in self._trades if trade.is_win]
-        losing_trades = [trade for trade in self._trades if not trade.is_win]
-        
-        self.average_win = sum(trade.pnl for trade in winning_trades) / len(winning_trades) if winning_trades else 0
-        self.average_loss = sum(abs(trade.pnl) for trade in losing_trades) / len(losing_trades) if losing_trades else 0
+        self.average_win = gross_profit / wins if wins else 0
+        self.average_loss = gross_loss / losses if losses else 0
         
         # Calculate profit factor
-        gross_profit = sum(trade.pnl for trade in winning_trades)
-        gross_loss = abs(sum(trade.pnl for trade in losing_trades))
         self.profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
         
         # Calculate backtest period
         if len(self._trades) > 1:
-            self.backtest_period = max(trade.exit_time for trade in self._trades) - min(trade.entry_time for trade in self._trades)
+            self.backtest_period = last_exit - first_entry
             
             # Calculate annualized return
             if self.backtest_period.days > 0:
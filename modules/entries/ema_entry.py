@@ -1,5 +1,5 @@
 from framework.interfaces import IEntryModule
-from modules.indicators import ema_is_rising, price_crosses_above_ema, golden_cross
+from modules.indicators import ema_is_rising, price_crosses_above_ema, golden_cross, StreamingEMA
 from typing import Dict, Any, List
 
 
@@ -20,6 +20,9 @@ class EMAEntry(IEntryModule):
         self.require_rising = require_rising
         self.require_price_above = require_price_above
         self.name = f"EMA{period}Entry"
+        
+        # Incremental EMA for streaming updates via process_tick()
+        self._ema = StreamingEMA(period)
     
     def should_enter(self, data: Dict[str, Any]) -> bool:
         """
@@ -47,6 +50,34 @@ class EMAEntry(IEntryModule):
         
         return conditions_met
     
+    def process_tick(self, price: float) -> bool:
+        """
+        Update the cached EMA with a new price and check entry conditions
+        O(1) per tick instead of recomputing the EMA over the full price history.
+        Gives the same signal as should_enter() with 'prices' ending in this price.
+        Args:
+            price: Latest price (appended to the stream)
+        Returns:
+            True if entry signal triggered
+        """
+        previous_ema = self._ema.value
+        current_ema = self._ema.update(price)
+        
+        if self._ema.count < self.period or previous_ema is None:
+            return False
+        
+        conditions_met = True
+        
+        # Check if EMA is rising (if required)
+        if self.require_rising:
+            conditions_met &= current_ema > previous_ema
+        
+        # Check if price crosses above EMA (if required)
+        if self.require_price_above:
+            conditions_met &= price > current_ema and price <= previous_ema
+        
+        return conditions_met
+    
     def get_module_name(self) -> str:
         return self.name
 
@@ -127,13 +127,12 @@ class VolaBreakoutEntry(IEntryModule):
         if len(highs) < self.recent_high_lookback + 1:
             return False
         
-        # Get recent highs excluding current price
-        recent_highs = highs[:-1]  # Exclude current
-        
-        if len(recent_highs) < self.recent_high_lookback:
-            recent_high = max(recent_highs) if recent_highs else 0
+        # Slice only the lookback window, excluding current price; a lookback
+        # of 0 covers all previous highs (0 if there are none)
+        if self.recent_high_lookback == 0:
+            recent_high = max(highs[:-1], default=0)
         else:
-            recent_high = max(recent_highs[-self.recent_high_lookback:])
+            recent_high = max(highs[-(self.recent_high_lookback + 1):-1])
         
         return current_price > recent_high
     
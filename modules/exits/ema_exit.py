@@ -3,7 +3,7 @@ EMA-based exit modules
 Converts C# EMA100Exit patterns to flexible Python
 """
 from framework.interfaces import IExitModule
-from modules.indicators import ema_is_falling, price_crosses_below_ema
+from modules.indicators import ema_is_falling, price_crosses_below_ema, StreamingEMA
 from typing import Dict, Any
 
 
@@ -25,6 +25,9 @@ class EMAExit(IExitModule):
         self.require_falling = require_falling
         self.require_price_below = require_price_below
         self.name = f"EMA{period}Exit"
+        
+        # Incremental EMA for streaming updates via process_tick()
+        self._ema = StreamingEMA(period)
     
     def should_exit(self, data: Dict[str, Any]) -> bool:
         """
@@ -52,6 +55,34 @@ class EMAExit(IExitModule):
         
         return conditions_met
     
+    def process_tick(self, price: float) -> bool:
+        """
+        Update the cached EMA with a new price and check exit conditions
+        O(1) per tick instead of recomputing the EMA over the full price history.
+        Gives the same signal as should_exit() with 'prices' ending in this price.
+        Args:
+            price: Latest price (appended to the stream)
+        Returns:
+            True if exit signal triggered
+        """
+        previous_ema = self._ema.value
+        current_ema = self._ema.update(price)
+        
+        if self._ema.count < self.period or previous_ema is None:
+            return False
+        
+        conditions_met = True
+        
+        # Check if EMA is falling (if required)
+        if self.require_falling:
+            conditions_met &= current_ema < previous_ema
+        
+        # Check if price crosses below EMA (if required)
+        if self.require_price_below:
+            conditions_met &= price < current_ema and price >= previous_ema
+        
+        return conditions_met
+    
     def get_module_name(self) -> str:
         return self.name
 
@@ -3,7 +3,7 @@ Trailing stop exit module
 Implements dynamic trailing stop loss functionality
 """
 from framework.interfaces import IExitModule
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 
 class TrailingStopExit(IExitModule):
@@ -65,6 +65,33 @@ class TrailingStopExit(IExitModule):
         
         return should_exit
     
+    def should_exit_series(self, prices: List[float], entry_price: float) -> Tuple[List[float], int]:
+        """
+        Compute the trailing stop trajectory for a whole price series in one pass
+        Mirrors repeated should_exit() calls for a long position without touching
+        the tracking state of this instance.
+        Args:
+            prices: Prices observed after entry, in order
+            entry_price: Price at which position was entered
+        Returns:
+            Tuple of (stop levels up to and including the exit bar, index of the
+            exit bar or -1 if the stop was never hit)
+        """
+        one_minus_trail = 1 - self.trail_percent
+        highest = entry_price
+        stop_level = entry_price * (1 - self.initial_stop_percent)
+        stops = []
+        
+        for i, price in enumerate(prices):
+            if price > highest:
+                highest = price
+                stop_level = max(stop_level, highest * one_minus_trail)
+            stops.append(stop_level)
+            if price <= stop_level:
+                return stops, i
+        
+        return stops, -1
+    
     def get_module_name(self) -> str:
         return self.name
     
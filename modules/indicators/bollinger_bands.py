@@ -60,11 +60,17 @@ def calculate_bollinger_bands(prices: List[float], period: int = 20, std_multipl
         current_price = prices[-1] if prices else 0.0
         return current_price, current_price, current_price
     
+    # Slice the window once and reuse it for both SMA and standard deviation
+    window = prices[-period:]
+    
     # Calculate middle band (SMA)
-    middle_band = calculate_sma(prices, period)
+    middle_band = sum(window) / period
     
     # Calculate standard deviation
-    std_dev = calculate_standard_deviation(prices, period, middle_band)
+    if period <= 1:
+        std_dev = 0.0
+    else:
+        std_dev = math.sqrt(sum((price - middle_band) ** 2 for price in window) / period)
     
     # Calculate upper and lower bands
     band_width = std_dev * std_multiplier
@@ -2,34 +2,119 @@
 Core EMA indicator functions
 Parametrized functions for maximum flexibility
 """
-from typing import List, Tuple
+from itertools import islice
+from typing import Iterator, List, Tuple
 
 
-def calculate_ema(prices: List[float], period: int) -> float:
+def _ema_upto(prices: List[float], period: int, end: int) -> float:
     """
-    Calculate EMA for given period using standard formula
+    EMA over prices[:end] without copying the list
     Args:
         prices: List of historical prices
-        period: EMA period (e.g., 50, 100, 200)
+        period: EMA period
+        end: Number of leading prices to use
     Returns:
-        Current EMA value
+        EMA value after prices[end - 1]
     """
-    if len(prices) < period:
+    if end < period:
         # Use SMA for initial values if not enough data
-        return sum(prices) / len(prices)
+        return sum(islice(prices, end)) / end
     
     # Start with SMA of first 'period' values
-    sma = sum(prices[:period]) / period
-    ema = sma
+    ema = sum(islice(prices, period)) / period
     
     # Calculate EMA for remaining values
     multiplier = 2.0 / (period + 1)
-    for price in prices[period:]:
-        ema = (price * multiplier) + (ema * (1 - multiplier))
+    decay = 1 - multiplier
+    for price in islice(prices, period, end):
+        ema = (price * multiplier) + (ema * decay)
     
     return ema
 
 
+def ema_advance(prev_ema: float, price: float, period: int) -> float:
+    """
+    Advance an EMA by one price
+    Args:
+        prev_ema: EMA value before this price
+        price: New price
+        period: EMA period
+    Returns:
+        EMA value including the new price
+    """
+    multiplier = 2.0 / (period + 1)
+    return (price * multiplier) + (prev_ema * (1 - multiplier))
+
+
+def yield_ema(prices: List[float], period: int) -> Iterator[float]:
+    """
+    Yield the EMA after each price in a single pass
+    Matches calculate_ema(prices[:i + 1], period) for every i (SMA until warmed up)
+    Args:
+        prices: List of historical prices
+        period: EMA period
+    Returns:
+        Iterator of EMA values, one per price
+    """
+    multiplier = 2.0 / (period + 1)
+    decay = 1 - multiplier
+    total = 0.0
+    ema = 0.0
+    for count, price in enumerate(prices, 1):
+        if count <= period:
+            total += price
+            ema = total / count
+        else:
+            ema = (price * multiplier) + (ema * decay)
+        yield ema
+
+
+class StreamingEMA:
+    """
+    EMA updated one price at a time, O(1) per update
+    Matches calculate_ema() over all prices seen so far (SMA until warmed up)
+    """
+    
+    def __init__(self, period: int):
+        """
+        Initialize streaming EMA
+        Args:
+            period: EMA period
+        """
+        self.period = period
+        self.value = None
+        self.count = 0
+        self._seed_sum = 0.0
+    
+    def update(self, price: float) -> float:
+        """
+        Advance the EMA by one price
+        Args:
+            price: New price
+        Returns:
+            EMA value including the new price
+        """
+        self.count += 1
+        if self.count <= self.period:
+            self._seed_sum += price
+            self.value = self._seed_sum / self.count
+        else:
+            self.value = ema_advance(self.value, price, self.period)
+        return self.value
+
+
+def calculate_ema(prices: List[float], period: int) -> float:
+    """
+    Calculate EMA for given period using standard formula
+    Args:
+        prices: List of historical prices
+        period: EMA period (e.g., 50, 100, 200)
+    Returns:
+        Current EMA value
+    """
+    return _ema_upto(prices, period, len(prices))
+
+
 def get_ema_values(prices: List[float], period: int) -> Tuple[float, float]:
     """
     Get current and previous EMA values
@@ -43,8 +128,12 @@ def get_ema_values(prices: List[float], period: int) -> Tuple[float, float]:
         current = calculate_ema(prices, period)
         return current, current
     
-    current = calculate_ema(prices, period)
-    previous = calculate_ema(prices[:-1], period)
+    previous = _ema_upto(prices, period, len(prices) - 1)
+    if len(prices) > period:
+        # Previous EMA is past warmup, so the current one is a single step on from it
+        current = ema_advance(previous, prices[-1], period)
+    else:
+        current = calculate_ema(prices, period)
     return current, previous
 
 
@@ -87,8 +176,7 @@ def price_crosses_above_ema(price: float, prices: List[float], period: int) -> b
     if len(prices) < 2:
         return False
     
-    ema_current = calculate_ema(prices, period)
-    ema_previous = calculate_ema(prices[:-1], period)
+    ema_current, ema_previous = get_ema_values(prices, period)
     
     return price > ema_current and prices[-1] <= ema_previous
 
@@ -106,8 +194,7 @@ def price_crosses_below_ema(price: float, prices: List[float], period: int) -> b
     if len(prices) < 2:
         return False
     
-    ema_current = calculate_ema(prices, period)
-    ema_previous = calculate_ema(prices[:-1], period)
+    ema_current, ema_previous = get_ema_values(prices, period)
     
     return price < ema_current and prices[-1] >= ema_previous
 
@@ -125,10 +212,8 @@ def ema_crosses_above_ema(prices: List[float], fast_period: int, slow_period: in
     if len(prices) < 2:
         return False
     
-    fast_current = calculate_ema(prices, fast_period)
-    slow_current = calculate_ema(prices, slow_period)
-    fast_previous = calculate_ema(prices[:-1], fast_period)
-    slow_previous = calculate_ema(prices[:-1], slow_period)
+    fast_current, fast_previous = get_ema_values(prices, fast_period)
+    slow_current, slow_previous = get_ema_values(prices, slow_period)
     
     return (fast_current > slow_current and fast_previous <= slow_previous)
 
@@ -146,9 +231,7 @@ def ema_crosses_below_ema(prices: List[float], fast_period: int, slow_period: in
     if len(prices) < 2:
         return False
     
-    fast_current = calculate_ema(prices, fast_period)
-    slow_current = calculate_ema(prices, slow_period)
-    fast_previous = calculate_ema(prices[:-1], fast_period)
-    slow_previous = calculate_ema(prices[:-1], slow_period)
+    fast_current, fast_previous = get_ema_values(prices, fast_period)
+    slow_current, slow_previous = get_ema_values(prices, slow_period)
     
     return (fast_current < slow_current and fast_previous >= slow_previous)
\ No newline at end of file
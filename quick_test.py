@@ -4,8 +4,11 @@ Quick test of our SPY EMA Strategy logic
 Since we have the Python algorithm ready, let's verify it works locally
 """
 
+import io
 import sys
 import datetime
+from array import array
+from functools import lru_cache
 from typing import List, Dict
 
 class MockData:
@@ -61,10 +64,14 @@ def test_spy_ema_strategy():
     cash = starting_capital
     shares = 0
     entry_price = 0
-    trades = []
     
-    print("Date        | Price   | EMA50   | EMA100  | Position | Action")
-    print("------------|---------|---------|---------|----------|------------------")
+    # Completed trades stored column-wise (one typed array per field)
+    trades = {field: array('d') for field in ('entry_price', 'exit_price', 'shares', 'pnl', 'pnl_pct')}
+    
+    # Buffer the progress table and print it once after the loop
+    table = io.StringIO()
+    table.write("Date        | Price   | EMA50   | EMA100  | Position | Action\n")
+    table.write("------------|---------|---------|---------|----------|------------------\n")
     
     for i, (date, price) in enumerate(prices):
         # Update EMAs
@@ -73,7 +80,6 @@ def test_spy_ema_strategy():
         
         # Strategy logic
         action = "HOLD"
-        current_value = cash + (shares * price)
         
         # Entry logic: Buy when price > EMA50 and we have no position
         if shares == 0 and price > ema50_val and len(ema50.values) >= 50:
@@ -92,20 +98,20 @@ def test_spy_ema_strategy():
             cash += shares * price
             pnl = shares * (price - entry_price)
             pnl_pct = (price - entry_price) / entry_price * 100
-            trades.append({
-                'entry_price': entry_price,
-                'exit_price': price,
-                'shares': shares,
-                'pnl': pnl,
-                'pnl_pct': pnl_pct
-            })
+            trades['entry_price'].append(entry_price)
+            trades['exit_price'].append(price)
+            trades['shares'].append(shares)
+            trades['pnl'].append(pnl)
+            trades['pnl_pct'].append(pnl_pct)
             action = f"SELL {shares:,} shares (P&L: ${pnl:,.0f}, {pnl_pct:+.1f}%)"
             shares = 0
         
         # Show significant dates or position changes
         if action != "HOLD" or i % 20 == 0:  # Show every 20th day + actions
             position = f"{shares:,} shares" if shares > 0 else "CASH"
-            print(f"{date:%m/%d/%Y} | ${price:6.2f} | ${ema50_val:6.2f} | ${ema100_val:6.2f} | {position:8} | {action}")
+            table.write(f"{date:%m/%d/%Y} | ${price:6.2f} | ${ema50_val:6.2f} | ${ema100_val:6.2f} | {position:8} | {action}\n")
+    
+    print(table.getvalue(), end="")
     
     # Final results
     final_value = cash + (shares * prices[-1][1])
@@ -117,37 +123,43 @@ def test_spy_ema_strategy():
     print(f"Starting Capital: ${starting_capital:,}")
     print(f"Final Portfolio:  ${final_value:,.0f}")
     print(f"Total Return:     {total_return:.2%}")
-    print(f"Total Trades:     {len(trades)}")
+    trade_count = len(trades['pnl'])
+    print(f"Total Trades:     {trade_count}")
     
-    if trades:
-        avg_return = sum(t['pnl_pct'] for t in trades) / len(trades)
-        winning_trades = [t for t in trades if t['pnl'] > 0]
-        win_rate = len(winning_trades) / len(trades) * 100
+    if trade_count:
+        avg_return = sum(trades['pnl_pct']) / trade_count
+        winning_trades = sum(1 for pnl in trades['pnl'] if pnl > 0)
+        win_rate = winning_trades / trade_count * 100
         
         print(f"Win Rate:         {win_rate:.1f}%")
         print(f"Average Return:   {avg_return:+.1f}% per trade")
         
         print()
         print("Trade Details:")
-        for i, trade in enumerate(trades, 1):
-            print(f"  Trade {i}: ${trade['entry_price']:.2f} -> ${trade['exit_price']:.2f} "
-                  f"({trade['pnl_pct']:+.1f}%) = ${trade['pnl']:,.0f}")
+        trade_rows = zip(trades['entry_price'], trades['exit_price'], trades['pnl_pct'], trades['pnl'])
+        for i, (entry, exit, pnl_pct, pnl) in enumerate(trade_rows, 1):
+            print(f"  Trade {i}: ${entry:.2f} -> ${exit:.2f} "
+                  f"({pnl_pct:+.1f}%) = ${pnl:,.0f}")
     
     print()
     print("LOCAL STRATEGY TEST COMPLETE!")
     print("This proves our strategy logic is working correctly.")
     print("Ready for QuantConnect deployment once we fix the directory name issue.")
 
-def generate_realistic_spy_data():
-    """Generate realistic SPY price data for testing"""
+@lru_cache(maxsize=4)
+def generate_realistic_spy_data(start_date=datetime.datetime(2025, 3, 1),  # Start early for EMA warmup
+                                end_date=datetime.datetime(2025, 9, 30),   # Q3 2025 end
+                                base_price=450.0):                         # Realistic SPY price for 2025
+    """
+    Generate realistic SPY price data for testing
+    Output is deterministic for the given arguments, so repeated calls are served
+    from cache. Returns an immutable tuple of (date, price) rows.
+    """
     import math
     
-    start_date = datetime.datetime(2025, 3, 1)  # Start early for EMA warmup
-    end_date = datetime.datetime(2025, 9, 30)   # Q3 2025 end
-    
     prices = []
     current_date = start_date
-    price = 450.0  # Realistic SPY price for 2025
+    price = base_price
     
     day_count = 0
     while current_date <= end_date:
@@ -169,7 +181,7 @@ def generate_realistic_spy_data():
         
         current_date += datetime.timedelta(days=1)
     
-    return prices
+    return tuple(prices)
 
 if __name__ == "__main__":
     test_spy_ema_strategy()
\ No newline at end of file
@@ -41,11 +41,16 @@ class VolaBreakoutStrategy(IStrategy):
         self.bbw_threshold = 0.1  # BBW threshold for low volatility
         self.recent_high_period = 5
         self.trail_percent = 0.05  # 5% trailing stop
+        self._one_minus_trail = 1 - self.trail_percent  # Stop multiplier, precomputed once
         
         # Indicators
         self.ema = algorithm.EMA(self.symbol, self.ema_period)
         self.bb = algorithm.BB(self.symbol, self.bb_period, self.bb_std)
         
+        # Recent bars for prev close / recent high lookups (window[0] is the current bar)
+        self.window = RollingWindow[TradeBar](self.recent_high_period + 2)
+        self._last_conditions = None
+        
         # State tracking
         self.position_entry_price = None
         self.highest_price_since_entry = None
@@ -68,16 +73,28 @@ class VolaBreakoutStrategy(IStrategy):
         """Process new market data"""
         if not data.ContainsKey(self.symbol) or data[self.symbol] is None:
             return
+        
+        # Fill the rolling window during warmup as well
+        bar = data[self.symbol]
+        self.window.Add(bar)
             
         if algorithm.IsWarmingUp:
             return
         
-        bar = data[self.symbol]
         current_price = bar.Close
         current_holdings = algorithm.Portfolio[self.symbol].Quantity
         
+        # Read Bollinger values once per bar (each .Current.Value crosses into C#)
+        bb_upper = self.bb.UpperBand.Current.Value
+        bb_lower = self.bb.LowerBand.Current.Value
+        bb_middle = self.bb.MiddleBand.Current.Value
+        bb_width = (bb_upper - bb_lower) / bb_middle if bb_middle > 0 else 1.0  # Normalized BBW
+        
+        # Evaluate entry conditions once per bar (shared by plotting and entry logic)
+        self._last_conditions = self._evaluate_entry_conditions(current_price, bb_upper, bb_width)
+        
         # Plot current data for debugging
-        self._plot_debug_data(algorithm, current_price)
+        self._plot_debug_data(algorithm, current_price, bb_upper, bb_lower, bb_middle, bb_width)
         
         # Entry logic
         if current_holdings == 0:
@@ -94,61 +111,80 @@ class VolaBreakoutStrategy(IStrategy):
         
         # Exit logic (trailing stop)
         elif current_holdings > 0:
-            if self._check_exit_conditions(current_price):
+            # Trailing stop: exit if price drops more than trail_percent from highest price
+            if current_price <= self.highest_price_since_entry * self._one_minus_trail:
                 algorithm.Liquidate(self.symbol)
                 algorithm.Log(f"EXIT: Sold SPY at ${current_price:.2f} (Entry: ${self.position_entry_price:.2f})")
                 self.position_entry_price = None
                 self.highest_price_since_entry = None
             else:
                 # Update highest price for trailing stop
-                if current_price > self.highest_price_since_entry:
-                    self.highest_price_since_entry = current_price
+                self.highest_price_since_entry = max(self.highest_price_since_entry, current_price)
 
-    def _check_entry_conditions(self, current_price):
-        """Check all entry conditions"""
+    def _evaluate_entry_conditions(self, current_price, bb_upper, bb_width):
+        """
+        Evaluate all entry conditions for the current bar
+        Args:
+            current_price: Close of the current bar
+            bb_upper: Cached upper Bollinger Band value
+            bb_width: Cached normalized Bollinger Band Width
+        Returns:
+            Dictionary of condition flags and values, or None if not ready
+        """
         if not self.ema.IsReady or not self.bb.IsReady:
-            return False
+            return None
         
-        # Get historical data for trend and momentum checks
-        history = self.algorithm.History(self.symbol, self.recent_high_period + 2, Resolution.DAILY)
-        if history.empty or len(history) < self.recent_high_period + 2:
-            return False
+        if not self.window.IsReady:
+            return None
         
         # 1. inTrend = price > ema and ema > ema[1]
         ema_current = self.ema.Current.Value
-        prev_close = float(history.iloc[-2]['close'])
+        prev_close = self.window[1].Close
         
         # Simple trend check: price above EMA and price rising
         in_trend = current_price > ema_current and current_price > prev_close
         
         # 2. isLowBBW = isReady and bbw < bbwThreshold
-        bb_upper = self.bb.UpperBand.Current.Value
-        bb_lower = self.bb.LowerBand.Current.Value
-        bb_middle = self.bb.MiddleBand.Current.Value
-        bb_width = (bb_upper - bb_lower) / bb_middle if bb_middle > 0 else 1.0  # Normalized BBW
         is_low_bbw = bb_width < self.bbw_threshold
         
         # 3. breakAboveBB = close > bbUpper
         break_above_bb = current_price > bb_upper
         
         # 4. breakAboveRecentHigh = close > ta.highest(high, 5)[1]
-        # Get highest high of last 5 days using history
-        try:
-            recent_highs = history['high'].iloc[-(self.recent_high_period+1):-1]  # Exclude today
-            recent_high = float(recent_highs.max())
-            break_above_recent_high = current_price > recent_high
-        except:
-            break_above_recent_high = False
+        # Highest high of the previous bars, excluding today
+        recent_high = max(self.window[i].High for i in range(1, self.recent_high_period + 1))
+        break_above_recent_high = current_price > recent_high
+        
+        # Every flag is evaluated so the debug plots show the real values;
+        # the entry signal short-circuits on the cheap float filters first
+        conditions = {
+            "ema_current": ema_current,
+            "bb_upper": bb_upper,
+            "bb_width": bb_width,
+            "recent_high": recent_high,
+            "in_trend": in_trend,
+            "is_low_bbw": is_low_bbw,
+            "break_above_bb": break_above_bb,
+            "break_above_recent_high": break_above_recent_high,
+            "entry_signal": is_low_bbw and break_above_bb and in_trend and break_above_recent_high
+        }
+        
+        return conditions
+
+    def _check_entry_conditions(self, current_price):
+        """Check all entry conditions"""
+        conditions = self._last_conditions
+        if conditions is None:
+            return False
         
-        # All conditions must be true
-        entry_signal = in_trend and is_low_bbw and break_above_bb and break_above_recent_high
+        entry_signal = conditions["entry_signal"]
         
         if entry_signal:
-            self.algorithm.Log(f"ENTRY SIGNAL: Price=${current_price:.2f}, EMA=${ema_current:.2f}, BBW={bb_width:.3f}, BB_Upper=${bb_upper:.2f}, Recent_High=${recent_high:.2f}")
+            self.algorithm.Log(f"ENTRY SIGNAL: Price=${current_price:.2f}, EMA=${conditions['ema_current']:.2f}, BBW={conditions['bb_width']:.3f}, BB_Upper=${conditions['bb_upper']:.2f}, Recent_High=${conditions['recent_high']:.2f}")
         
         return entry_signal
 
-    def _plot_debug_data(self, algorithm, current_price):
+    def _plot_debug_data(self, algorithm, current_price, bb_upper, bb_lower, bb_middle, bb_width):
         """Plot debugging data to charts"""
         if not self.ema.IsReady or not self.bb.IsReady:
             return
@@ -156,49 +192,25 @@ class VolaBreakoutStrategy(IStrategy):
         # Plot Price & Indicators
         algorithm.Plot("Price & Indicators", "SPY Price", current_price)
         algorithm.Plot("Price & Indicators", "EMA50", self.ema.Current.Value)
-        algorithm.Plot("Price & Indicators", "BB Upper", self.bb.UpperBand.Current.Value)
-        algorithm.Plot("Price & Indicators", "BB Lower", self.bb.LowerBand.Current.Value)
-        algorithm.Plot("Price & Indicators", "BB Middle", self.bb.MiddleBand.Current.Value)
+        algorithm.Plot("Price & Indicators", "BB Upper", bb_upper)
+        algorithm.Plot("Price & Indicators", "BB Lower", bb_lower)
+        algorithm.Plot("Price & Indicators", "BB Middle", bb_middle)
         
         # Plot Bollinger Band Width
-        bb_upper = self.bb.UpperBand.Current.Value
-        bb_lower = self.bb.LowerBand.Current.Value
-        bb_middle = self.bb.MiddleBand.Current.Value
-        bb_width = (bb_upper - bb_lower) / bb_middle if bb_middle > 0 else 0
-        
         algorithm.Plot("Bollinger Band Width", "BBW", bb_width)
         algorithm.Plot("Bollinger Band Width", "BBW Threshold", self.bbw_threshold)
         
         # Plot Entry Conditions (as flags when true)
-        try:
-            history = algorithm.History(self.symbol, self.recent_high_period + 2, Resolution.DAILY)
-            if not history.empty and len(history) >= self.recent_high_period + 2:
-                
-                # Check individual conditions
-                ema_current = self.ema.Current.Value
-                prev_close = float(history.iloc[-2]['close'])
-                in_trend = current_price > ema_current and current_price > prev_close
-                
-                is_low_bbw = bb_width < self.bbw_threshold
-                break_above_bb = current_price > bb_upper
-                
-                recent_highs = history['high'].iloc[-(self.recent_high_period+1):-1]
-                recent_high = float(recent_highs.max())
-                break_above_recent_high = current_price > recent_high
-                
-                # Plot flags (1 when condition is true, 0 otherwise)
-                algorithm.Plot("Entry Conditions", "Trend OK", 1 if in_trend else 0)
-                algorithm.Plot("Entry Conditions", "Low Vol OK", 1 if is_low_bbw else 0)
-                algorithm.Plot("Entry Conditions", "BB Breakout OK", 1 if break_above_bb else 0)
-                algorithm.Plot("Entry Conditions", "Momentum OK", 1 if break_above_recent_high else 0)
-                
-                # Overall entry signal
-                entry_signal = in_trend and is_low_bbw and break_above_bb and break_above_recent_high
-                algorithm.Plot("Entry Conditions", "Entry Signal", 1 if entry_signal else 0)
-                
-        except Exception as e:
-            # Don't let plotting errors break the strategy
-            pass
+        conditions = self._last_conditions
+        if conditions is not None:
+            # Plot flags (1 when condition is true, 0 otherwise)
+            algorithm.Plot("Entry Conditions", "Trend OK", 1 if conditions["in_trend"] else 0)
+            algorithm.Plot("Entry Conditions", "Low Vol OK", 1 if conditions["is_low_bbw"] else 0)
+            algorithm.Plot("Entry Conditions", "BB Breakout OK", 1 if conditions["break_above_bb"] else 0)
+            algorithm.Plot("Entry Conditions", "Momentum OK", 1 if conditions["break_above_recent_high"] else 0)
+            
+            # Overall entry signal
+            algorithm.Plot("Entry Conditions", "Entry Signal", 1 if conditions["entry_signal"] else 0)
         
         # Plot Position & Performance
         position_value = algorithm.Portfolio[self.symbol].HoldingsValue
@@ -209,15 +221,6 @@ class VolaBreakoutStrategy(IStrategy):
         algorithm.Plot("Position & Performance", "Cash", cash)
         algorithm.Plot("Position & Performance", "Total Portfolio", total_portfolio)
 
-    def _check_exit_conditions(self, current_price):
-        """Check trailing stop exit condition"""
-        if self.highest_price_since_entry is None:
-            return False
-        
-        # Trailing stop: exit if price drops more than trail_percent from highest price
-        stop_price = self.highest_price_since_entry * (1 - self.trail_percent)
-        return current_price <= stop_price
-
     def on_end_of_algorithm(self, algorithm):
         """Called at the end of the algorithm"""
         final_portfolio_value = algorithm.Portfolio.TotalPortfolioValue
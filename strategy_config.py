@@ -1,7 +1,3 @@
-# region imports
-from AlgorithmImports import *
-# endregion
-
 """
 Strategy configuration constants
 """
@@ -28,4 +24,9 @@ RUN_ID = ""  # Auto-generate unique ID if empty
 LOG_TRADES = True
 LOG_DAILY_PERFORMANCE = True
 LOG_INDICATORS = True
-LOG_ENTRY_CONDITIONS = True
\ No newline at end of file
+LOG_ENTRY_CONDITIONS = True
+
+# Debug output configuration - per-bar logs and plots
+LOG_BARS = True
+DEBUG_PLOTS = True
+DEBUG_PLOT_EVERY_N_BARS = 1  # Plot every Nth bar (1 = every bar)
\ No newline at end of file
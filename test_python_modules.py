@@ -58,13 +58,20 @@ def test_ema_calculations():
     try:
         print("\nTesting EMA calculations...")
         
-        from modules.indicators import calculate_ema, ema50_rising, ema_crosses_above_ema
+        from modules.indicators import calculate_ema, yield_ema, ema50_rising, ema_crosses_above_ema
         
         # Test basic EMA calculation
         prices = [100, 101, 102, 103, 104, 105]
         ema = calculate_ema(prices, 5)
         print(f"✓ EMA calculation: {ema:.2f}")
         
+        # Test single-pass EMA series against a full recompute at every bar
+        for i, value in enumerate(yield_ema(prices, 3)):
+            expected = calculate_ema(prices[:i + 1], 3)
+            if abs(value - expected) > 1e-9:
+                raise AssertionError(f"yield_ema mismatch at bar {i}: {value} != {expected}")
+        print("✓ EMA series matches calculate_ema")
+        
         # Test EMA rising
         is_rising = ema50_rising(prices)
         print(f"✓ EMA50 rising: {is_rising}")
@@ -110,6 +117,35 @@ def test_module_creation():
         return False
 
 
+def test_incremental_ema():
+    """Test that process_tick matches the full-history module signals"""
+    try:
+        print("\nTesting incremental EMA ticks...")
+        
+        from modules.entries import EMAEntry
+        from modules.exits import EMAExit
+        
+        prices = [100, 102, 101, 104, 103, 106, 105, 103, 101, 99, 100, 98]
+        entry = EMAEntry(period=3, require_price_above=False)
+        exit = EMAExit(period=3, require_price_below=False)
+        reference_entry = EMAEntry(period=3, require_price_above=False)
+        reference_exit = EMAExit(period=3, require_price_below=False)
+        
+        for i, price in enumerate(prices):
+            data = {'prices': prices[:i + 1], 'current_price': price}
+            if entry.process_tick(price) != reference_entry.should_enter(data):
+                raise AssertionError(f"Entry tick mismatch at bar {i}")
+            if exit.process_tick(price) != reference_exit.should_exit(data):
+                raise AssertionError(f"Exit tick mismatch at bar {i}")
+        
+        print(f"✓ Incremental EMA matches full recompute over {len(prices)} ticks")
+        return True
+        
+    except Exception as e:
+        print(f"Incremental EMA test failed: {str(e)}")
+        return False
+
+
 def test_strategy_builder():
     """Test strategy builder functionality"""
     try:
@@ -163,6 +199,7 @@ def main():
         test_imports,
         test_ema_calculations,
         test_module_creation,
+        test_incremental_ema,
         test_strategy_builder
     ]
     
@@ -188,4 +225,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Block-buffer stdout; flushed before an uncaught error's traceback is printed
+    sys.stdout.reconfigure(line_buffering=False)
+    try:
+        main()
+    finally:
+        sys.stdout.flush()
\ No newline at end of file
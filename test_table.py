@@ -1,32 +1,41 @@
 """
 Simple table formatting test
 """
-import glob
 import os
+import re
 from calculate_performance import calculate_performance_from_file, compare_with_strategy
 from strategy_config import SYMBOL, TIMEFRAME_MINUTES, START_DATE, END_DATE, STARTING_CAPITAL
 from mock_backtest import get_mock_strategy_metrics
 
+# Data file paths found so far, keyed by symbol (misses are not cached)
+_DATA_FILE_CACHE = {}
+
 def find_symbol_data_file(symbol):
     """
     Find the data file for a given symbol, looking for any daily data file
-    Returns the path to the first matching file found
+    Returns the path to the first matching file found (cached per symbol once found)
     """
+    cached = _DATA_FILE_CACHE.get(symbol)
+    if cached is not None:
+        return cached
+    
     data_dir = f"data/{symbol.lower()}"
-    if not os.path.exists(data_dir):
+    if not os.path.isdir(data_dir):
         print(f"ERROR: Data directory not found: {data_dir}")
         return None
     
-    # Look for any daily data file for this symbol
-    pattern = f"{data_dir}/{symbol}_DAILY_*.csv"
-    matching_files = glob.glob(pattern)
-    
-    if not matching_files:
-        print(f"ERROR: No daily data files found for {symbol} in {data_dir}")
-        return None
+    # Look for any daily data file for this symbol (single directory scan)
+    pattern = re.compile(rf"{re.escape(symbol)}_DAILY_.*\.csv")
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            # Return the first matching file (should usually be only one)
+            if entry.is_file() and pattern.fullmatch(entry.name):
+                path = os.path.join(data_dir, entry.name)
+                _DATA_FILE_CACHE[symbol] = path
+                return path
     
-    # Return the first matching file (should usually be only one)
-    return matching_files[0]
+    print(f"ERROR: No daily data files found for {symbol} in {data_dir}")
+    return None
 
 def test_table_only():
     """Test just the table formatting"""
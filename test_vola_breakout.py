@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from modules.indicators import (
-    calculate_ema, ema_is_rising, 
+    calculate_ema, ema_advance, ema_is_rising, 
     calculate_bollinger_bands, bb_width_20_period, is_bollinger_ready,
     get_recent_high
 )
@@ -48,8 +48,9 @@ def test_ema_conditions():
     uptrend_prices = [100 + i * 0.5 for i in range(60)]  # Steady uptrend
     current_price = uptrend_prices[-1] + 1  # Price above trend
     
-    ema50 = calculate_ema(uptrend_prices, 50)
+    # One full pass for the previous EMA, then a single step for the current one
     ema50_prev = calculate_ema(uptrend_prices[:-1], 50)
+    ema50 = ema_advance(ema50_prev, uptrend_prices[-1], 50)
     
     price_above_ema = current_price > ema50
     ema_rising = ema50 > ema50_prev
@@ -70,27 +71,27 @@ def test_vola_breakout_entry():
     entry = VolaBreakoutEntry(ema_period=20, bbw_threshold=0.15)  # More lenient settings
     
     # Generate test scenario: low vol compression then breakout
-    base_prices = []
+    # One preallocated buffer holds base, breakout and current prices
+    n_base, n_break = 30, 5
+    prices = [0.0] * (n_base + n_break + 1)
     
     # Phase 1: Low volatility base (30 days)
-    for i in range(30):
-        price = 100 + (i * 0.1) + ((-1) ** i) * 0.2  # Small oscillations around trend
-        base_prices.append(price)
+    for i in range(n_base):
+        prices[i] = 100 + (i * 0.1) + ((-1) ** i) * 0.2  # Small oscillations around trend
     
     # Phase 2: Breakout setup (5 days of higher highs)
-    breakout_prices = base_prices.copy()
-    for i in range(5):
-        price = breakout_prices[-1] + 1.0 + i * 0.5
-        breakout_prices.append(price)
+    for i in range(n_break):
+        prices[n_base + i] = prices[n_base + i - 1] + 1.0 + i * 0.5
     
     # Test current breakout day
-    current_price = breakout_prices[-1] + 2.0  # Strong breakout move
+    prices[-1] = prices[-2] + 2.0  # Strong breakout move
+    current_price = prices[-1]
     
-    # Prepare test data
+    # Prepare test data (highs alias the same list, no copy)
     test_data = {
-        'prices': breakout_prices + [current_price],
+        'prices': prices,
         'current_price': current_price,
-        'highs': breakout_prices + [current_price]  # Use same for highs
+        'highs': prices
     }
     
     # Test individual conditions
@@ -123,6 +124,33 @@ def test_trailing_stop():
     
     print(f"  Entry Price: ${entry_price:.2f}")
     
+    stateful_stops, triggered = _run_trailing_stop(trailing_stop, prices, entry_price, verbose=True)
+    
+    # The one-pass series must match the per-bar stop levels and exit bar
+    if not _series_matches(trailing_stop, prices, entry_price, stateful_stops, triggered):
+        return False
+    
+    # Same check for a trade that does hit its stop
+    falling_prices = [100.0, 104.0, 101.0, 98.0]
+    fresh_stop = TrailingStopExit(trail_percent=0.05, initial_stop_percent=0.02)
+    stateful_stops, triggered = _run_trailing_stop(fresh_stop, falling_prices, entry_price)
+    if triggered != 3:
+        print(f"  Trailing Stop: FAIL (expected exit on bar 3, got {triggered})")
+        return False
+    if not _series_matches(fresh_stop, falling_prices, entry_price, stateful_stops, triggered):
+        return False
+    
+    print("  Trailing Stop: PASS")
+    return True
+
+
+def _run_trailing_stop(trailing_stop, prices, entry_price, verbose=False):
+    """
+    Feed prices to the stateful should_exit() one bar at a time
+    Returns:
+        Tuple of (stop levels of the bars before the exit, exit bar index or -1)
+    """
+    stops = []
     for i, price in enumerate(prices):
         test_data = {
             'current_price': price,
@@ -133,13 +161,33 @@ def test_trailing_stop():
         should_exit = trailing_stop.should_exit(test_data)
         stop_level = trailing_stop.get_current_stop_level()
         
-        print(f"  Day {i+1}: Price ${price:.2f}, Stop ${stop_level:.2f}, Exit: {should_exit}")
+        if verbose:
+            print(f"  Day {i+1}: Price ${price:.2f}, Stop ${stop_level:.2f}, Exit: {should_exit}")
         
         if should_exit:
-            print(f"  >>> STOP TRIGGERED at ${price:.2f}")
-            break
+            if verbose:
+                print(f"  >>> STOP TRIGGERED at ${price:.2f}")
+            return stops, i
+        stops.append(stop_level)
     
-    print("  Trailing Stop: PASS")
+    return stops, -1
+
+
+def _series_matches(trailing_stop, prices, entry_price, stateful_stops, triggered):
+    """Check should_exit_series() against the stateful stop levels and exit bar"""
+    series_stops, series_triggered = trailing_stop.should_exit_series(prices, entry_price)
+    
+    # The stateful tracker resets on exit, so the exit bar's level is not compared
+    if series_triggered != -1:
+        series_stops = series_stops[:-1]
+    
+    if series_triggered != triggered:
+        print(f"  Trailing Stop: FAIL (series exit bar {series_triggered}, per-bar exit bar {triggered})")
+        return False
+    if series_stops != stateful_stops:
+        print(f"  Trailing Stop: FAIL (series stops {series_stops} != per-bar stops {stateful_stops})")
+        return False
+    return True
 
 
 def main():
@@ -147,24 +195,26 @@ def main():
     print("VOLA BREAKOUT MODULES TEST")
     print("=" * 40)
     
-    try:
-        test_bollinger_bands()
-        print()
-        test_ema_conditions()
-        print()
-        test_vola_breakout_entry()
-        print()
-        test_trailing_stop()
-        print()
-        print("=" * 40)
-        print("ALL VOLA BREAKOUT TESTS PASSED!")
-        print("The new strategy modules are working correctly.")
-        
-    except Exception as e:
-        print(f"TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    test_bollinger_bands()
+    print()
+    test_ema_conditions()
+    print()
+    test_vola_breakout_entry()
+    print()
+    trailing_stop_ok = test_trailing_stop()
+    print()
+    print("=" * 40)
+    if not trailing_stop_ok:
+        print("SOME VOLA BREAKOUT TESTS FAILED!")
+        return
+    print("ALL VOLA BREAKOUT TESTS PASSED!")
+    print("The new strategy modules are working correctly.")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Block-buffer stdout; flushed before an uncaught error's traceback is printed
+    sys.stdout.reconfigure(line_buffering=False)
+    try:
+        main()
+    finally:
+        sys.stdout.flush()
\ No newline at end of file
@@ -11,7 +11,7 @@ zero_values_output = """Started backtest named 'Crawling Brown Badger' for proje
 +-----------------------------------------------------------------------------+
 Backtest id: test"""
 
-parser = QCOutputParser(zero_values_output)
+parser = QCOutputParser.from_text(zero_values_output)
 
 print("Testing potential issues with zero values...")
 print("=" * 50)
@@ -44,14 +44,19 @@ print(f"Raw performance_metrics: {data['performance_metrics']}")
 print(f"Raw risk_metrics: {data['risk_metrics']}")
 print(f"Raw trade_metrics: {data['trade_metrics']}")
 
-# Check if any values are None
-def check_for_none_values(data_dict, path=""):
-    for key, value in data_dict.items():
-        current_path = f"{path}.{key}" if path else key
-        if isinstance(value, dict):
-            check_for_none_values(value, current_path)
-        elif value is None:
-            print(f"Found None value at: {current_path}")
+# Check if any values are None (iterative walk; the path is only joined on a hit)
+def check_for_none_values(data_dict):
+    stack = [(iter(data_dict.items()), ())]
+    while stack:
+        items, path = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                stack.append((iter(value.items()), path + (key,)))
+                break
+            if value is None:
+                print(f"Found None value at: {'.'.join(path + (key,))}")
+        else:
+            stack.pop()
 
 print("\nChecking for None values in parsed data:")
 check_for_none_values(data)
\ No newline at end of file
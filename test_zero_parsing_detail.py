@@ -1,7 +1,7 @@
 """
 Deep test of parser's _parse_metric_value method with various zero formats
 """
-from utils import QCOutputParser
+from utils import QCOutputParser, _METRICS_MAP
 
 # Create a test parser instance using the working zero values output
 zero_values_output = """Started backtest named 'Test' for project 'Test'
@@ -11,7 +11,7 @@ zero_values_output = """Started backtest named 'Test' for project 'Test'
 +-----------------------------------------------------------------------------+
 Backtest id: test"""
 
-parser = QCOutputParser(zero_values_output)
+parser = QCOutputParser.from_text(zero_values_output)
 
 # Test various zero value formats
 test_values = [
@@ -44,27 +44,24 @@ for test_val in test_values:
         print(f"'{test_val}' -> ERROR: {e}")
 
 print("\n" + "=" * 60)
-print("Testing problematic regex patterns...")
-
-# Test if the regex patterns are matching zero values correctly
-import re
+print("Testing table parsing of zero values...")
 
+# Parse zero-value table rows through the same path as a real backtest output
 test_output = """
 | Total Orders             | 0           | Average Win               | 0%     |
 | Return                   | 0.00 %      | Sharpe Ratio              | 0      |
 | Fees                     | -$0.00      | Net Profit                | $0.00  |
+| Drawdown                 | 0%          |                           |        |
 """
 
-# Test the regex pattern used in the parser
+parsed_output = parser._parse_output(test_output)
 metrics_to_test = ["Total Orders", "Average Win", "Return", "Sharpe Ratio", "Fees", "Net Profit"]
 
 for metric in metrics_to_test:
-    pattern = rf"{re.escape(metric)}\s*\|\s*([^\|]+?)(?:\s*\||\s*$)"
-    match = re.search(pattern, test_output, re.MULTILINE)
+    category, json_key = _METRICS_MAP[metric]
     
-    if match:
-        raw_value = match.group(1).strip()
-        parsed = parser._parse_metric_value(raw_value)
-        print(f"{metric}: '{raw_value}' -> {parsed} (type: {type(parsed).__name__})")
+    if json_key in parsed_output[category]:
+        parsed = parsed_output[category][json_key]
+        print(f"{metric}: {parsed} (type: {type(parsed).__name__})")
     else:
         print(f"{metric}: NO MATCH FOUND")
\ No newline at end of file
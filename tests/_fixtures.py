@@ -0,0 +1,56 @@
+"""
+Shared fixtures for the zero-value parser tests
+"""
+import sys
+import os
+
+# Add parent directory to path to import utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import QCOutputParser
+
+# QuantConnect output of a 1-day backtest where every statistic is zero
+ZERO_VALUES_OUTPUT = """Started compiling project 'QC_Trading_Framework_DEPLOY'
+Build Request Successful for Project ID: 26025124, with CompileID:
+4ba20836df5fb58e7b7e151371171b70-6443afc94a19947d280ef2b9af425d48, Lean
+Version: 2.5.0.0.17369
+Successfully compiled project 'QC_Trading_Framework_DEPLOY'
+Started backtest named 'Crawling Brown Badger' for project
+'QC_Trading_Framework_DEPLOY'
+Backtest url:
+https://www.quantconnect.com/project/26025124/ff008bb7776bbf4ba315a74d03cf4487
+ ---------------------------------------- 100%
++-----------------------------------------------------------------------------+
+| Statistic                | Value       | Statistic                 | Value  |
+|--------------------------+-------------+---------------------------+--------|
+| Equity                   | $100,000.00 | Fees                      | -$0.00 |
+| Holdings                 | $0.00       | Net Profit                | $0.00  |
+| Probabilistic Sharpe     | 0%          | Return                    | 0.00 % |
+| Ratio                    |             |                           |        |
+| Strategy Version         | v2.1.65     | Unrealized                | $0.00  |
+| Volume                   | $0.00       |                           |        |
+|--------------------------+-------------+---------------------------+--------|
+| Total Orders             | 0           | Average Win               | 0%     |
+| Average Loss             | 0%          | Compounding Annual Return | 0%     |
+| Drawdown                 | 0%          | Expectancy                | 0      |
+| Start Equity             | 100000      | End Equity                | 100000 |
+| Net Profit               | 0%          | Sharpe Ratio              | 0      |
+| Sortino Ratio            | 0           | Probabilistic Sharpe      | 0%     |
+|                          |             | Ratio                     |        |
+| Loss Rate                | 0%          | Win Rate                  | 0%     |
+| Profit-Loss Ratio        | 0           | Alpha                     | 0      |
+| Beta                     | 0           | Annual Standard Deviation | 0      |
+| Annual Variance          | 0           | Information Ratio         | -1.647 |
+| Tracking Error           | 0.105       | Treynor Ratio             | 0      |
+| Total Fees               | $0.00       | Estimated Strategy        | $0     |
+|                          |             | Capacity                  |        |
+| Lowest Capacity Asset    |             | Portfolio Turnover        | 0%     |
+| Drawdown Recovery        | 0           |                           |        |
++-----------------------------------------------------------------------------+
+Backtest id: ff008bb7776bbf4ba315a74d03cf4487
+Backtest name: Crawling Brown Badger
+Backtest url:
+https://www.quantconnect.com/project/26025124/ff008bb7776bbf4ba315a74d03cf4487"""
+
+# Parsed once at import and shared by every test that needs it
+ZERO_PARSER = QCOutputParser.from_text(ZERO_VALUES_OUTPUT)
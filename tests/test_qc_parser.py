@@ -4,6 +4,7 @@ Unit tests for QuantConnect output parser
 import unittest
 import sys
 import os
+import json
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,12 +16,13 @@ from examples.backtest_outputs_from_qc import get_backtest_output, get_negative_
 class TestQCOutputParser(unittest.TestCase):
     """Test cases for QuantConnect output parser"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.positive_output = get_backtest_output()
-        self.negative_output = get_negative_backtest_output()
-        self.positive_parser = QCOutputParser(self.positive_output)
-        self.negative_parser = QCOutputParser(self.negative_output)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures once for the class (parsers are read-only)"""
+        cls.positive_output = get_backtest_output()
+        cls.negative_output = get_negative_backtest_output()
+        cls.positive_parser = QCOutputParser.from_text(cls.positive_output)
+        cls.negative_parser = QCOutputParser.from_text(cls.negative_output)
     
     def test_parse_positive_return(self):
         """Test parsing positive return values"""
@@ -164,6 +166,31 @@ class TestQCOutputParser(unittest.TestCase):
         # Test with indentation
         json_indented = self.positive_parser.to_json(indent=2)
         self.assertIn('\n', json_indented)  # Should have newlines when indented
+        
+        # Output format is the stdlib json one
+        self.assertEqual(json_str, json.dumps(self.positive_parser.to_dict(include_raw=False)))
+        self.assertEqual(json_indented, json.dumps(self.positive_parser.to_dict(include_raw=False), indent=2))
+    
+    def test_raw_output_optional(self):
+        """Test that raw output is only serialized when requested"""
+        self.assertNotIn("raw_output", self.positive_parser.to_dict(include_raw=False))
+        self.assertNotIn("raw_output", json.loads(self.positive_parser.to_json()))
+        
+        data = json.loads(self.positive_parser.to_json(include_raw=True))
+        self.assertEqual(data["raw_output"], self.positive_output)
+    
+    def test_to_dict_returns_copy(self):
+        """Test that changing a to_dict result does not leak into the parser"""
+        parser = QCOutputParser(self.positive_output)
+        json_before = parser.to_json()
+        
+        data = parser.to_dict()
+        data["risk_metrics"]["sharpe_ratio"] = 99.0
+        data["performance_metrics"].clear()
+        
+        self.assertAlmostEqual(parser.get_sharpe_ratio(), 0.235, places=3)
+        self.assertAlmostEqual(parser.to_dict()["performance_metrics"]["return_percent"], 10.48, places=2)
+        self.assertEqual(parser.to_json(), json_before)
     
     def test_backward_compatibility(self):
         """Test that old function still works"""
@@ -174,6 +201,60 @@ class TestQCOutputParser(unittest.TestCase):
         self.assertIn("return_percent", result["performance_metrics"])
         self.assertAlmostEqual(result["performance_metrics"]["return_percent"], 10.48, places=2)
     
+    def test_exact_label_matching(self):
+        """Test that longer labels ending in a metric name are not mistaken for it"""
+        output = (
+            "| Total Fees | $9.99 | Probabilistic Sharpe Ratio | 55% |\n"
+            "| Return | 1.5 % | Sharpe Ratio | 0.8 |\n"
+            "| Drawdown | 2% | Fees | -$1.25 |\n"
+        )
+        parser = QCOutputParser(output)
+        
+        self.assertAlmostEqual(parser.get_sharpe_ratio(), 0.8, places=2)
+        self.assertAlmostEqual(parser.get_total_fees(), -1.25, places=2)
+    
+    def test_from_text_reuses_parse(self):
+        """Test that from_text returns the cached parser for identical output"""
+        first = QCOutputParser.from_text(self.positive_output)
+        second = QCOutputParser.from_text(self.positive_output)
+        
+        self.assertIs(first, second)
+        self.assertAlmostEqual(first.get_return_percent(), 10.48, places=2)
+    
+    def test_table_at_start_of_output(self):
+        """Test that a table border on the very first line is recognized"""
+        output = (
+            "+---------------------------------------------+\n"
+            "| Return | 1.5 % | Sharpe Ratio | 0.8 |\n"
+            "| Drawdown | 2% | Total Orders | 3 |\n"
+            "+---------------------------------------------+\n"
+            "Backtest id: abc123"
+        )
+        parser = QCOutputParser(output)
+        
+        self.assertAlmostEqual(parser.get_return_percent(), 1.5, places=2)
+        self.assertEqual(parser.get_total_orders(), 3)
+    
+    def test_table_after_carriage_return(self):
+        """Test that a top border following a progress line's "\\r" is recognized"""
+        output = (
+            "Started backtest named 'Test' for project 'Test'\n"
+            "100%\r+---------------------------------------------+\n"
+            "| Return | 1.5 % | Sharpe Ratio | 0.8 |\n"
+            "| Drawdown | 2% | Total Orders | 3 |\n"
+            "+---------------------------------------------+\n"
+            "Backtest id: abc123"
+        )
+        parser = QCOutputParser(output)
+        
+        self.assertAlmostEqual(parser.get_return_percent(), 1.5, places=2)
+        self.assertAlmostEqual(parser.get_max_drawdown_percent(), 2.0, places=2)
+        self.assertEqual(parser.get_total_orders(), 3)
+        
+        # An indented top border falls back to scanning the whole text
+        parser = QCOutputParser(output.replace("100%\r+", "  +"))
+        self.assertEqual(parser.get_total_orders(), 3)
+    
     def test_invalid_output_handling(self):
         """Test handling of invalid/incomplete output"""
         invalid_output = "This is not a valid QuantConnect output"
@@ -2,31 +2,104 @@
 Shared utility functions for the trading framework
 """
 import re
+import sys
 import json
+from functools import lru_cache
+from types import MappingProxyType
+
+# Characters dropped from numeric cells before float(): thousands separators, and "$" for dollar values
+_COMMA_TABLE = str.maketrans("", "", ",")
+_DOLLAR_TABLE = str.maketrans("", "", ",$")
+
+# Header fields outside the statistics table, matched in one pass (group name = info key);
+# the URL sits on the line after its label and is picked up by a line walk instead
+_HEADER_RE = re.compile(
+    r"Started backtest named '(?P<name>[^']+)'"
+    r"|Backtest id: (?P<id>[a-f0-9]+)"
+)
+
+# ANSI color codes, written around the message by print() instead of building a new string
+_RED = "\033[91m"
+_GREEN = "\033[92m"
+_YELLOW = "\033[93m"
+_RESET = "\033[0m"
+_ERROR_PREFIX = _RED + "ERROR: "
+_SUCCESS_PREFIX = _GREEN + "SUCCESS: "
+_WARNING_PREFIX = _YELLOW + "WARNING: "
 
 def print_red(message):
     """Print message in red color"""
-    print(f"\033[91m{message}\033[0m")
+    print(_RED, message, _RESET, sep="")
 
 def print_green(message):
     """Print message in green color"""
-    print(f"\033[92m{message}\033[0m")
+    print(_GREEN, message, _RESET, sep="")
 
 def print_yellow(message):
     """Print message in yellow color"""
-    print(f"\033[93m{message}\033[0m")
+    print(_YELLOW, message, _RESET, sep="")
 
 def print_error(message):
     """Print error message in red"""
-    print_red(f"ERROR: {message}")
+    print(_ERROR_PREFIX, message, _RESET, sep="")
 
 def print_success(message):
     """Print success message in green"""
-    print_green(f"SUCCESS: {message}")
+    print(_SUCCESS_PREFIX, message, _RESET, sep="")
 
 def print_warning(message):
     """Print warning message in yellow"""
-    print_yellow(f"WARNING: {message}")
+    print(_WARNING_PREFIX, message, _RESET, sep="")
+
+
+# Statistics table metrics and their (category, json key); read-only. Names are
+# interned so lookups against the (also interned) table labels compare by identity
+_METRICS_MAP = MappingProxyType({sys.intern(name): target for name, target in {
+    # Performance metrics
+    "Equity": ("performance_metrics", "final_equity"),
+    "Return": ("performance_metrics", "return_percent"),
+    "Compounding Annual Return": ("performance_metrics", "annual_return_percent"),
+    "End Equity": ("performance_metrics", "end_equity"),
+    "Start Equity": ("performance_metrics", "start_equity"),
+    "Net Profit": ("performance_metrics", "net_profit_percent"),
+    
+    # Risk metrics
+    "Drawdown": ("risk_metrics", "max_drawdown_percent"),
+    "Sharpe Ratio": ("risk_metrics", "sharpe_ratio"),
+    "Sortino Ratio": ("risk_metrics", "sortino_ratio"),
+    "Probabilistic Sharpe Ratio": ("risk_metrics", "probabilistic_sharpe_ratio"),
+    "Annual Standard Deviation": ("risk_metrics", "annual_std_dev"),
+    "Annual Variance": ("risk_metrics", "annual_variance"),
+    "Alpha": ("risk_metrics", "alpha"),
+    "Beta": ("risk_metrics", "beta"),
+    "Information Ratio": ("risk_metrics", "information_ratio"),
+    "Tracking Error": ("risk_metrics", "tracking_error"),
+    "Treynor Ratio": ("risk_metrics", "treynor_ratio"),
+    
+    # Trade metrics
+    "Total Orders": ("trade_metrics", "total_orders"),
+    "Average Win": ("trade_metrics", "average_win_percent"),
+    "Average Loss": ("trade_metrics", "average_loss_percent"),
+    "Expectancy": ("trade_metrics", "expectancy"),
+    "Loss Rate": ("trade_metrics", "loss_rate_percent"),
+    "Win Rate": ("trade_metrics", "win_rate_percent"),
+    "Profit-Loss Ratio": ("trade_metrics", "profit_loss_ratio"),
+    "Fees": ("trade_metrics", "total_fees"),
+    "Volume": ("trade_metrics", "volume"),
+    "Holdings": ("trade_metrics", "holdings"),
+    "Unrealized": ("trade_metrics", "unrealized"),
+    "Portfolio Turnover": ("trade_metrics", "portfolio_turnover"),
+    "Estimated Strategy Capacity": ("trade_metrics", "strategy_capacity"),
+    "Lowest Capacity Asset": ("trade_metrics", "lowest_capacity_asset"),
+    "Drawdown Recovery": ("trade_metrics", "drawdown_recovery"),
+}.items()})
+
+# Table labels of the metrics every valid output must have, with their json keys
+_ESSENTIAL_LABELS = (
+    ("Return", "return_percent"),
+    ("Sharpe Ratio", "sharpe_ratio"),
+    ("Drawdown", "max_drawdown_percent"),
+)
 
 
 class QCOutputParser:
@@ -40,6 +113,10 @@ class QCOutputParser:
         name = parser.get_backtest_name()
     """
     
+    # Raw text, parsed result by category (without the raw text), a flat key -> value view for getters,
+    # and serialized JSON keyed by to_json arguments
+    __slots__ = ("raw_output", "_parsed", "_flat", "_json_cache")
+    
     def __init__(self, qc_output):
         """
         Initialize parser with QuantConnect output.
@@ -51,7 +128,31 @@ class QCOutputParser:
             ValueError: If required fields cannot be parsed from output
         """
         self.raw_output = qc_output
-        self.data = self._parse_output(qc_output)
+        self._parsed = self._parse_output(qc_output)
+        self._flat = {key: value for section in self._parsed.values() for key, value in section.items()}
+        self._json_cache = {}
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def from_text(cls, qc_output):
+        """
+        Get a parser for the given output, reusing an earlier parse of the same text.
+        
+        The cache is keyed by the full output text, which identifies the parse
+        completely (the parser keeps no other input). The returned instance is
+        shared between callers; this is safe because it never hands out its
+        internal data (to_dict returns copies).
+        
+        Args:
+            qc_output (str): Raw QuantConnect backtest output string
+            
+        Returns:
+            QCOutputParser: Parser for the output
+            
+        Raises:
+            ValueError: If required fields cannot be parsed from output
+        """
+        return cls(qc_output)
     
     def _parse_output(self, qc_output):
         """
@@ -61,7 +162,7 @@ class QCOutputParser:
             qc_output (str): Raw QuantConnect backtest output string
             
         Returns:
-            dict: Parsed backtest results
+            dict: Parsed backtest results (without the raw output)
             
         Raises:
             ValueError: If required fields cannot be parsed from output
@@ -70,104 +171,89 @@ class QCOutputParser:
             "backtest_info": {},
             "performance_metrics": {},
             "risk_metrics": {},
-            "trade_metrics": {},
-            "raw_output": qc_output
+            "trade_metrics": {}
         }
         
-        try:
-            # Extract backtest name
-            backtest_name_match = re.search(r"Started backtest named '([^']+)'", qc_output)
-            if backtest_name_match:
-                result["backtest_info"]["name"] = backtest_name_match.group(1)
-            
-            # Extract backtest ID
-            backtest_id_match = re.search(r"Backtest id: ([a-f0-9]+)", qc_output)
-            if backtest_id_match:
-                result["backtest_info"]["id"] = backtest_id_match.group(1)
-            
-            # Extract backtest URL
-            backtest_url_match = re.search(r"Backtest url:\s*\n(https://[^\s]+)", qc_output)
-            if backtest_url_match:
-                result["backtest_info"]["url"] = backtest_url_match.group(1)
-            
-            # Extract strategy version
-            version_match = re.search(r"Strategy Version\s*\|\s*([^\s]+)", qc_output)
-            if version_match:
-                result["backtest_info"]["strategy_version"] = version_match.group(1)
-            
-            # Parse the statistics table
-            # Define metrics and their categories
-            metrics_map = {
-                # Performance metrics
-                "Equity": ("performance_metrics", "final_equity"),
-                "Return": ("performance_metrics", "return_percent"),
-                "Compounding Annual Return": ("performance_metrics", "annual_return_percent"),
-                "End Equity": ("performance_metrics", "end_equity"),
-                "Start Equity": ("performance_metrics", "start_equity"),
-                "Net Profit": ("performance_metrics", "net_profit_percent"),
-                
-                # Risk metrics
-                "Drawdown": ("risk_metrics", "max_drawdown_percent"),
-                "Sharpe Ratio": ("risk_metrics", "sharpe_ratio"),
-                "Sortino Ratio": ("risk_metrics", "sortino_ratio"),
-                "Probabilistic Sharpe Ratio": ("risk_metrics", "probabilistic_sharpe_ratio"),
-                "Annual Standard Deviation": ("risk_metrics", "annual_std_dev"),
-                "Annual Variance": ("risk_metrics", "annual_variance"),
-                "Alpha": ("risk_metrics", "alpha"),
-                "Beta": ("risk_metrics", "beta"),
-                "Information Ratio": ("risk_metrics", "information_ratio"),
-                "Tracking Error": ("risk_metrics", "tracking_error"),
-                "Treynor Ratio": ("risk_metrics", "treynor_ratio"),
-                
-                # Trade metrics
-                "Total Orders": ("trade_metrics", "total_orders"),
-                "Average Win": ("trade_metrics", "average_win_percent"),
-                "Average Loss": ("trade_metrics", "average_loss_percent"),
-                "Expectancy": ("trade_metrics", "expectancy"),
-                "Loss Rate": ("trade_metrics", "loss_rate_percent"),
-                "Win Rate": ("trade_metrics", "win_rate_percent"),
-                "Profit-Loss Ratio": ("trade_metrics", "profit_loss_ratio"),
-                "Fees": ("trade_metrics", "total_fees"),
-                "Volume": ("trade_metrics", "volume"),
-                "Holdings": ("trade_metrics", "holdings"),
-                "Unrealized": ("trade_metrics", "unrealized"),
-                "Portfolio Turnover": ("trade_metrics", "portfolio_turnover"),
-                "Estimated Strategy Capacity": ("trade_metrics", "strategy_capacity"),
-                "Lowest Capacity Asset": ("trade_metrics", "lowest_capacity_asset"),
-                "Drawdown Recovery": ("trade_metrics", "drawdown_recovery")
-            }
-            
-            # Parse each metric from the table
-            for metric_name, (category, json_key) in metrics_map.items():
-                # Look for the metric in the table format
-                pattern = rf"{re.escape(metric_name)}\s*\|\s*([^\|]+?)(?:\s*\||\s*$)"
-                match = re.search(pattern, qc_output, re.MULTILINE)
-                
-                if match:
-                    raw_value = match.group(1).strip()
-                    parsed_value = self._parse_metric_value(raw_value)
-                    result[category][json_key] = parsed_value
-            
-            # Validate that we got essential metrics
-            essential_metrics = ["return_percent", "sharpe_ratio", "max_drawdown_percent"]
-            missing_metrics = []
-            
-            for metric in essential_metrics:
-                found = False
-                for category in ["performance_metrics", "risk_metrics"]:
-                    if metric in result[category]:
-                        found = True
-                        break
-                if not found:
-                    missing_metrics.append(metric)
-            
-            if missing_metrics:
-                raise ValueError(f"Failed to parse essential metrics: {missing_metrics}")
-            
-            return result
-            
-        except Exception as e:
-            raise ValueError(f"Failed to parse QuantConnect output: {str(e)}")
+        # Fail fast on output that cannot contain the essential metrics: no table
+        # at all, or an essential label that never appears in the text
+        if "|" not in qc_output:
+            missing_metrics = [json_key for _, json_key in _ESSENTIAL_LABELS]
+        else:
+            missing_metrics = [json_key for label, json_key in _ESSENTIAL_LABELS if label not in qc_output]
+        if missing_metrics:
+            raise ValueError(f"Failed to parse essential metrics: {missing_metrics}")
+        
+        # Extract backtest name and ID in a single scan (first occurrence wins)
+        header = {}
+        for match in _HEADER_RE.finditer(qc_output):
+            header.setdefault(match.lastgroup, match.group(match.lastgroup))
+        
+        # Extract backtest URL: the first non-blank line after a "Backtest url:" line
+        after_url_label = False
+        for line in qc_output.splitlines():
+            if after_url_label:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith("https://"):
+                    header["url"] = line.split(None, 1)[0]
+                    break
+                after_url_label = False
+            after_url_label = line.rstrip().endswith("Backtest url:")
+        
+        for key in ("name", "id", "url"):
+            if key in header:
+                result["backtest_info"][key] = header[key]
+        
+        # Statistics table body, between the first and last "+---" border lines;
+        # the compile/backtest preamble is skipped by all table lookups. A top border
+        # may follow a "\r" (progress output) instead of a newline. Unless two distinct
+        # borders are found the whole text is scanned, as lines without "|" are skipped
+        if qc_output.startswith("+-"):
+            table_start = 0
+        else:
+            table_start = min(
+                (pos for pos in (qc_output.find("\n+-"), qc_output.find("\r+-")) if pos != -1),
+                default=-1
+            )
+        table_end = qc_output.rfind("\n+-")
+        if table_start != -1 and table_end > table_start:
+            table_text = qc_output[table_start:table_end]
+        else:
+            table_text = qc_output
+        
+        # Parse the statistics table
+        # Tokenize the table once: each label cell maps to the cell after it
+        # (first occurrence wins, like a top-down search)
+        table_cells = {}
+        for line in table_text.splitlines():
+            if "|" not in line:
+                continue
+            cells = line.split("|")
+            for label, value in zip(cells, cells[1:]):
+                label = sys.intern(label.strip())
+                if label and label not in table_cells:
+                    table_cells[label] = value
+        
+        # Extract strategy version (first word of its value cell)
+        version_words = table_cells.get("Strategy Version", "").split()
+        if version_words:
+            result["backtest_info"]["strategy_version"] = version_words[0]
+        
+        # Parse each metric from the table
+        for metric_name, (category, json_key) in _METRICS_MAP.items():
+            raw_value = table_cells.get(metric_name)
+            if raw_value is not None:
+                result[category][json_key] = self._parse_metric_value(raw_value)
+        
+        # Validate that we got essential metrics
+        found = result["performance_metrics"].keys() | result["risk_metrics"].keys()
+        missing_metrics = [json_key for _, json_key in _ESSENTIAL_LABELS if json_key not in found]
+        
+        if missing_metrics:
+            raise ValueError(f"Failed to parse essential metrics: {missing_metrics}")
+        
+        return result
     
     def _parse_metric_value(self, raw_value):
         """
@@ -177,40 +263,33 @@ class QCOutputParser:
             raw_value (str): Raw value from QuantConnect output
             
         Returns:
-            Union[float, int, str]: Parsed value
+            Union[float, str, None]: Parsed value
         """
         # Remove common formatting
         clean_value = raw_value.strip()
         
         # Handle empty or dash values
-        if not clean_value or clean_value == "-" or clean_value == "":
+        if not clean_value or clean_value == "-":
             return None
         
-        # Handle percentage values
-        if clean_value.endswith("%"):
+        # Dispatch on the first/last character instead of trying each format in turn
+        if clean_value[-1] == "%":
+            # Handle percentage values
             try:
-                return float(clean_value[:-1].strip())
+                return float(clean_value[:-1])
             except ValueError:
                 return clean_value
         
-        # Handle dollar values
-        if clean_value.startswith("$") or clean_value.startswith("-$"):
+        if clean_value[0] == "$" or clean_value.startswith("-$"):
+            # Handle dollar values (remove $ and commas, keep the sign)
             try:
-                # Remove $ and commas, handle negative
-                numeric_part = clean_value.replace("$", "").replace(",", "")
-                return float(numeric_part)
+                return float(clean_value.translate(_DOLLAR_TABLE))
             except ValueError:
                 return clean_value
         
-        # Try to parse as float
+        # Plain number, possibly with thousands separators
         try:
-            return float(clean_value.replace(",", ""))
-        except ValueError:
-            pass
-        
-        # Try to parse as int
-        try:
-            return int(clean_value.replace(",", ""))
+            return float(clean_value.translate(_COMMA_TABLE))
         except ValueError:
             pass
         
@@ -220,99 +299,126 @@ class QCOutputParser:
     # Getter methods for important metrics
     def get_backtest_name(self):
         """Get the backtest name"""
-        return self.data["backtest_info"].get("name")
+        return self._flat.get("name")
     
     def get_backtest_id(self):
         """Get the backtest ID"""
-        return self.data["backtest_info"].get("id")
+        return self._flat.get("id")
     
     def get_backtest_url(self):
         """Get the backtest URL"""
-        return self.data["backtest_info"].get("url")
+        return self._flat.get("url")
     
     def get_strategy_version(self):
         """Get the strategy version"""
-        return self.data["backtest_info"].get("strategy_version")
+        return self._flat.get("strategy_version")
     
     def get_return_percent(self):
         """Get the return percentage"""
-        return self.data["performance_metrics"].get("return_percent")
+        return self._flat.get("return_percent")
     
     def get_annual_return_percent(self):
         """Get the annual return percentage"""
-        return self.data["performance_metrics"].get("annual_return_percent")
+        return self._flat.get("annual_return_percent")
     
     def get_net_profit_percent(self):
         """Get the net profit percentage"""
-        return self.data["performance_metrics"].get("net_profit_percent")
+        return self._flat.get("net_profit_percent")
     
     def get_final_equity(self):
         """Get the final equity value"""
-        return self.data["performance_metrics"].get("final_equity")
+        return self._flat.get("final_equity")
     
     def get_end_equity(self):
         """Get the end equity value"""
-        return self.data["performance_metrics"].get("end_equity")
+        return self._flat.get("end_equity")
     
     def get_start_equity(self):
         """Get the start equity value"""
-        return self.data["performance_metrics"].get("start_equity")
+        return self._flat.get("start_equity")
     
     def get_max_drawdown_percent(self):
         """Get the maximum drawdown percentage"""
-        return self.data["risk_metrics"].get("max_drawdown_percent")
+        return self._flat.get("max_drawdown_percent")
     
     def get_sharpe_ratio(self):
         """Get the Sharpe ratio"""
-        return self.data["risk_metrics"].get("sharpe_ratio")
+        return self._flat.get("sharpe_ratio")
     
     def get_sortino_ratio(self):
         """Get the Sortino ratio"""
-        return self.data["risk_metrics"].get("sortino_ratio")
+        return self._flat.get("sortino_ratio")
     
     def get_alpha(self):
         """Get the Alpha"""
-        return self.data["risk_metrics"].get("alpha")
+        return self._flat.get("alpha")
     
     def get_beta(self):
         """Get the Beta"""
-        return self.data["risk_metrics"].get("beta")
+        return self._flat.get("beta")
     
     def get_total_orders(self):
         """Get the total number of orders"""
-        return self.data["trade_metrics"].get("total_orders")
+        return self._flat.get("total_orders")
     
     def get_win_rate_percent(self):
         """Get the win rate percentage"""
-        return self.data["trade_metrics"].get("win_rate_percent")
+        return self._flat.get("win_rate_percent")
     
     def get_loss_rate_percent(self):
         """Get the loss rate percentage"""
-        return self.data["trade_metrics"].get("loss_rate_percent")
+        return self._flat.get("loss_rate_percent")
     
     def get_profit_loss_ratio(self):
         """Get the profit-loss ratio"""
-        return self.data["trade_metrics"].get("profit_loss_ratio")
+        return self._flat.get("profit_loss_ratio")
     
     def get_total_fees(self):
         """Get the total fees"""
-        return self.data["trade_metrics"].get("total_fees")
+        return self._flat.get("total_fees")
     
     def get_expectancy(self):
         """Get the expectancy"""
-        return self.data["trade_metrics"].get("expectancy")
+        return self._flat.get("expectancy")
     
     def get_raw_output(self):
         """Get the raw QuantConnect output"""
         return self.raw_output
     
-    def to_dict(self):
-        """Get the full parsed data as dictionary"""
-        return self.data
+    def to_dict(self, include_raw=True):
+        """
+        Get the parsed data as dictionary.
+        
+        Args:
+            include_raw (bool): Add the raw output under "raw_output" (by reference, not copied)
+            
+        Returns:
+            dict: Copy of the parsed backtest results; changing it does not affect the parser
+        """
+        data = {section: dict(values) for section, values in self._parsed.items()}
+        if include_raw:
+            data["raw_output"] = self.raw_output
+        return data
     
-    def to_json(self, indent=None):
-        """Get the parsed data as JSON string"""
-        return json.dumps(self.data, indent=indent)
+    def to_json(self, indent=None, include_raw=False):
+        """
+        Get the parsed data as JSON string.
+        
+        Args:
+            indent (int): JSON indentation, None for compact output
+            include_raw (bool): Also serialize the (large) raw output
+            
+        Returns:
+            str: Parsed backtest results as JSON (cached per argument combination)
+        """
+        key = (indent, include_raw)
+        cached = self._json_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        cached = json.dumps(self.to_dict(include_raw), indent=indent)
+        self._json_cache[key] = cached
+        return cached
 
 
 # Backward compatibility function
@@ -7,62 +7,91 @@ import sys
 from datetime import datetime
 from utils import print_error, print_success
 
+CONFIG_FILE = "strategy_config.py"
+
+# Literal prefix of the STRATEGY_VERSION = "..." line in strategy_config.py
+_VERSION_KEY = 'STRATEGY_VERSION = "'
+
+# Version strings like "v2.1.0" (leading "v" optional)
+_VERSION_RE = re.compile(r"v?(\d+)\.(\d+)\.(\d+)")
+
+def _find_version(content):
+    """
+    Locate the quoted version string in the config source
+    Args:
+        content: Text of strategy_config.py
+    Returns:
+        (start, end) slice bounds of the version string, or None if not found
+    """
+    start = content.find(_VERSION_KEY)
+    if start < 0:
+        return None
+    start += len(_VERSION_KEY)
+    end = content.find('"', start)
+    if end < 0:
+        return None
+    return start, end
+
 def get_next_version(current_version):
     """Auto-increment patch version (e.g., v2.1.0 -> v2.1.1)"""
-    try:
-        # Extract version numbers from string like "v2.1.0"
-        version_part = current_version.replace('v', '')
-        major, minor, patch = map(int, version_part.split('.'))
-        
-        # Increment patch version
-        new_patch = patch + 1
-        return f"v{major}.{minor}.{new_patch}"
-    except:
+    version_match = _VERSION_RE.fullmatch(current_version)
+    if not version_match:
         # Fallback if parsing fails
         return f"v2.1.{int(datetime.now().timestamp()) % 1000}"
+    
+    # Increment patch version
+    major, minor, patch = map(int, version_match.groups())
+    return f"v{major}.{minor}.{patch + 1}"
+
+def read_config_version(config_file=CONFIG_FILE):
+    """
+    Read STRATEGY_VERSION straight from the config file (no module import/reload)
+    Args:
+        config_file: Path to the strategy config
+    Returns:
+        Version string, or None if the line is missing
+    """
+    with open(config_file, 'r') as f:
+        content = f.read()
+    bounds = _find_version(content)
+    return content[bounds[0]:bounds[1]] if bounds else None
 
 def update_version():
     """Update version in strategy_config.py"""
-    config_file = "strategy_config.py"
+    config_file = CONFIG_FILE
     
-    # Read current config file
-    with open(config_file, 'r') as f:
+    # Read and rewrite the config file through a single handle
+    with open(config_file, 'r+') as f:
         content = f.read()
-    
-    # Extract current version
-    version_match = re.search(r'STRATEGY_VERSION = "([^"]*)"', content)
-    if not version_match:
-        return "ERROR: Could not find STRATEGY_VERSION in strategy_config.py"
-    
-    current_version = version_match.group(1)
-    next_version = get_next_version(current_version)
-    
-    # Replace version line
-    updated_content = re.sub(
-        r'STRATEGY_VERSION = "[^"]*"',
-        f'STRATEGY_VERSION = "{next_version}"',
-        content
-    )
-    
-    # Write back to config file
-    with open(config_file, 'w') as f:
+        
+        # Extract current version
+        bounds = _find_version(content)
+        if not bounds:
+            return "ERROR: Could not find STRATEGY_VERSION in strategy_config.py"
+        
+        start, end = bounds
+        current_version = content[start:end]
+        next_version = get_next_version(current_version)
+        
+        # Replace version line (there is only one)
+        updated_content = content[:start] + next_version + content[end:]
+        
+        # Write back to config file
+        f.seek(0)
+        f.truncate()
         f.write(updated_content)
     
     return next_version
 
 def update_version_with_validation():
     """Update version and validate it worked - clean output"""
-    from strategy_config import STRATEGY_VERSION
-    original_version = STRATEGY_VERSION
+    original_version = read_config_version()
     
     # Update the version
     new_version = update_version()
     
-    # Reload to check if it actually changed
-    import importlib
-    import strategy_config
-    importlib.reload(strategy_config)
-    actual_version = strategy_config.STRATEGY_VERSION
+    # Re-read the file to check if it actually changed
+    actual_version = read_config_version()
     
     if original_version == actual_version:
         print_error(f"Version update failed! Version remained unchanged at {original_version}")